@@ -5,15 +5,17 @@ Ambilight + Static/Rainbow/Breathing/Cycle Modes, Windows-Autostart,
 persistente Einstellungen.
 """
 
-import sys, os, time, threading, colorsys, math, json
+import sys, os, time, threading, math, json, queue
+from collections import deque
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, colorchooser
 import numpy as np
-import pywinusb.hid as hid
 
-import mss
-import pystray
-from PIL import Image, ImageDraw, ImageTk
+# pywinusb, mss, dxcam, pystray und PIL werden lazy an den Verwendungs-
+# stellen importiert: HID-DLL-Init, Win32-COM (mss) und das PIL-Paket
+# kosten beim Kaltstart spürbar Zeit, bevor das Fenster überhaupt steht
+# (relevant für den Windows-Autostart).
 
 # === Hardware ===
 VID, PID = 0x1A86, 0xFE07
@@ -35,6 +37,9 @@ ASPECT_RATIOS = {
 
 MODES = ["Ambilight", "🎮 Gaming", "🎬 Film", "Statisch", "Rainbow", "Breathing", "Color Cycle"]
 
+# Gebundene %-Formatierung: ein Formatierungs-Opcode statt drei FORMAT_VALUE
+_rgb_to_hex = "#%02x%02x%02x".__mod__
+
 # Presets: (smoothing%, fps, edge%)
 MODE_PRESETS = {
     "🎮 Gaming": (5, 120, 4),    # Extrem reaktiv, max 120 FPS, schmaler Rand
@@ -81,22 +86,55 @@ DEFAULT_CONFIG = {
     "autostart_mode": False,   # Auto-Start beim Öffnen
 }
 
+# orjson (C-Extension) ist für die kleine Config nicht nötig, aber wenn es
+# ohnehin installiert ist, nehmen wir den schnelleren Codec mit
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_cfg_cache = {"mtime": None, "data": None}
+
 def load_config():
+    """Config lesen — mit mtime-Cache, damit wiederholte Aufrufe die JSON
+    nicht jedes Mal neu parsen. Gibt immer eine Kopie zurück."""
     path = get_config_path()
     cfg = dict(DEFAULT_CONFIG)
-    if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                saved = json.load(f)
-            cfg.update(saved)
-        except: pass
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        if _cfg_cache["mtime"] != mtime:
+            with open(path, "rb") as f:
+                raw = f.read()
+            _cfg_cache["data"] = orjson.loads(raw) if orjson else json.loads(raw)
+            _cfg_cache["mtime"] = mtime
+        cfg.update(_cfg_cache["data"])
+    except (OSError, ValueError): pass
     return cfg
 
+_last_saved_cfg = None
+
 def save_config(cfg):
+    """Config schreiben — übersprungen, wenn sich seit dem letzten
+    erfolgreichen Schreiben nichts geändert hat (schont SSD bei
+    häufigen Aufrufen, z.B. aus GUI-Callbacks).
+
+    Geschrieben wird atomar über eine Temp-Datei plus os.replace, damit
+    bei einem Absturz mitten im Schreiben keine halbe JSON zurückbleibt."""
+    global _last_saved_cfg
+    if cfg == _last_saved_cfg:
+        return
+    path = get_config_path()
+    tmp = path + ".tmp"
     try:
-        with open(get_config_path(), "w") as f:
-            json.dump(cfg, f, indent=2)
-    except: pass
+        if orjson is not None:
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(cfg))
+        else:
+            with open(tmp, "w") as f:
+                json.dump(cfg, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        _last_saved_cfg = dict(cfg)
+    except (OSError, TypeError, ValueError): pass
 
 
 # =============================================================================
@@ -145,9 +183,14 @@ def get_exe_path():
     return os.path.abspath(__file__)
 
 def is_autostart_enabled():
-    bat = os.path.join(get_startup_folder(), "DX-Light-Ambilight.bat")
-    lnk = os.path.join(get_startup_folder(), "DX-Light-Ambilight.lnk")
-    return os.path.exists(bat) or os.path.exists(lnk)
+    startup = get_startup_folder()
+    for name in ("DX-Light-Ambilight.bat", "DX-Light-Ambilight.lnk"):
+        try:
+            os.stat(os.path.join(startup, name))
+            return True
+        except OSError:
+            continue
+    return False
 
 def set_autostart(enable):
     startup = get_startup_folder()
@@ -174,41 +217,61 @@ def set_autostart(enable):
 # =============================================================================
 
 def find_device():
+    import pywinusb.hid as hid
     devs = hid.HidDeviceFilter(vendor_id=VID, product_id=PID).get_devices()
     return devs[0] if devs else None
 
 
+# --- Vorberechnete Puffer-Geometrie für build_and_send -----------------------
+# Protokoll-Slots wie im C++-Original: a[0] separat, dann drei 12er-Blöcke ab
+# a[1], a[12], a[24] (a[12] wird dadurch doppelt gesendet).
+_SLOT_SRC = [0] + list(range(1, 13)) + list(range(12, 24)) + list(range(24, 36))
+# LED-Reihenfolge -> Protokoll-Array a. Netto-Umordnung der früheren
+# Dreifach-Umkehr: normal läuft nur links rückwärts; gespiegelt hebt sich
+# die doppelte Links-Umkehr auf (rechts landet unumgekehrt vorn), oben und
+# die neue rechte Seite laufen je einmal rückwärts.
+_ORDER_NORMAL = list(range(12))[::-1] + list(range(12, 36))
+_ORDER_MIRROR = list(range(24, 36)) + list(range(12, 24))[::-1] + list(range(12))[::-1]
+_TAKE_NORMAL = np.array([_ORDER_NORMAL[s] for s in _SLOT_SRC], np.intp)
+_TAKE_MIRROR = np.array([_ORDER_MIRROR[s] for s in _SLOT_SRC], np.intp)
+# Byte-Positionen der Farbwerte im 192er-Puffer (3 Bytes je Slot)
+_COLOR_POS = np.array([7, 8, 9] + [10 + 5*k + c for k in range(36) for c in (2, 3, 4)],
+                      np.intp)
+# Template mit Header und den konstanten Zähler-Bytes
+_BUF_TEMPLATE = bytearray(192)
+_BUF_TEMPLATE[0:7] = HEADER
+_c = 1
+for _k in range(36):
+    _BUF_TEMPLATE[10 + 5*_k] = _c & 0xFF; _c += 1
+    _BUF_TEMPLATE[10 + 5*_k + 1] = _c & 0xFF; _c += 1
+del _c, _k
+
+# Persistente Sende-Puffer: nur Zähler-Byte und Farbbytes ändern sich pro
+# Frame, alles andere bleibt in-place stehen (ein Gerät, ein Sender-Thread).
+_SEND_BUF = bytearray(_BUF_TEMPLATE)
+_SEND_BUF_NP = np.frombuffer(_SEND_BUF, np.uint8)
+_SEND_BUF_MV = memoryview(_SEND_BUF)
+_REPORT = bytearray(65)   # Byte 0 = Report-ID (0x00), danach 64 Datenbytes
+
+
 def build_and_send(out, leds, cnt, mirror=False):
-    buf = bytearray(192)
-    buf[0:7] = HEADER
-    buf[4] = cnt & 0xFF
-    if mirror:
-        left_src  = leds[24:36][::-1]
-        right_src = leds[0:12][::-1]
-        top_src   = list(reversed(leds[12:24]))
-    else:
-        left_src  = leds[0:12]
-        right_src = leds[24:36]
-        top_src   = list(leds[12:24])
-    left = [left_src[11-i] for i in range(N)]
-    a = left + top_src + list(right_src)
-    buf[7], buf[8], buf[9] = a[0]
-    p, c = 10, 1
-    for s in (1, 12, 24):
-        for i in range(12):
-            buf[p] = c & 0xFF; c += 1
-            buf[p+1] = c & 0xFF; c += 1
-            buf[p+2], buf[p+3], buf[p+4] = a[s+i]
-            p += 5
+    # Umsortierung komplett über die vorberechnete Index-Tabelle
+    a = np.asarray(leds, np.uint8).take(_TAKE_MIRROR if mirror else _TAKE_NORMAL, axis=0)
+    _SEND_BUF[4] = cnt & 0xFF
+    _SEND_BUF_NP[_COLOR_POS] = a.ravel()
     for i in range(3):
-        out.set_raw_data([0x00] + list(buf[i*64:(i+1)*64]))
+        _REPORT[1:65] = _SEND_BUF_MV[i*64:(i+1)*64]
+        out.set_raw_data(_REPORT)
         out.send()
         # Small delay to prevent the device buffer from overflowing
         # (Fixes the issue where the first packet/left side gets dropped)
         time.sleep(0.002)
 
 
+@lru_cache(maxsize=32)
 def calc_region(mon_w, mon_h, aspect):
+    # aspect ist None oder ein Tupel aus ASPECT_RATIOS — hashbar, und
+    # Monitorgröße/Aspect sind quasi konstant, also lohnt der Cache.
     if aspect is None:
         return (0.0, 0.0, 0.0, 0.0)
     aw, ah = aspect
@@ -230,7 +293,54 @@ def calc_region(mon_w, mon_h, aspect):
 # Engine
 # =============================================================================
 
+@lru_cache(maxsize=8)
+def _sampler_geometry(h, w, crop, edge_pct):
+    """Sampling-Geometrie für eine (Auflösung, Crop, Randtiefe)-Kombination.
+
+    Crop-Pixel, Stride und Randbreite hängen nur von diesen Parametern ab —
+    per lru_cache spezialisiert, damit die Integer-Arithmetik nicht in jedem
+    Frame neu läuft. Die Randstreifen werden in voller Auflösung über ihre
+    komplette Tiefe gemittelt (Box-Filter statt Pixel-Skipping — weniger
+    Flackern); nur entlang der Zonenachse wird auf ~360 Samples gestridet.
+    Liefert drei (Zeilen-Slice, Spalten-Slice)-Paare für links/oben/rechts.
+    """
+    cl, ct, cr_, cb = crop
+    x0, y0 = int(w * cl), int(h * ct)
+    x1, y1 = max(x0+1, int(w * (1.0 - cr_))), max(y0+1, int(h * (1.0 - cb)))
+    scale = max(1, (y1 - y0) // 360)
+    edge = max(2, int(min(x1 - x0, y1 - y0) * edge_pct))
+    rows = slice(y0, y1, scale)   # Zonenachse links/rechts
+    cols = slice(x0, x1, scale)   # Zonenachse oben
+    left  = (rows, slice(x0, min(x0 + edge, x1)))
+    top   = (slice(y0, min(y0 + edge, y1)), cols)
+    right = (rows, slice(max(x0, x1 - edge), x1))
+    return left, top, right
+
+
+def _set_timer_resolution(enable):
+    """Windows-Timerauflösung auf 1 ms stellen, damit time.sleep nah an den
+    Frame-Deadlines aufwacht (Standard wären ~15.6 ms Granularität)."""
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        if enable:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    except: pass
+
+
 class LedEngine:
+    """LED-Engine: Capture/Compute-Thread + HID-Sender-Thread.
+
+    Bewusst Threads statt multiprocessing: Capture (mss/dxcam), die
+    NumPy-Reduktionen und die HID-Writes laufen in nativem Code und geben
+    den GIL frei, und das pywinusb-Gerätehandle lässt sich nicht in einen
+    Kindprozess picklen. Die GUI liest current_leds/preview_frame direkt
+    aus demselben Prozess.
+    """
+
     def __init__(self):
         self.running = False
         self.thread = None
@@ -248,11 +358,27 @@ class LedEngine:
         self.crop = (0.0, 0.0, 0.0, 0.0)
         self.monitor_idx = 1
         self.actual_fps = 0.0
-        self.current_leds = [(0,0,0)] * 36
+        self.current_leds = np.zeros((36, 3), np.uint8)
+        self._led_out = np.zeros((36, 3), np.uint8)  # Wiederverwendeter Sampler-Output
+        self._hue_offsets = np.arange(36) / 36.0     # Hue-Verteilung für Rainbow
+        # Persistente Arbeits-Arrays des Capture-Threads (keine Allokationen
+        # pro Frame) + FPS-Ringpuffer statt wachsender Liste
+        self._cur = np.zeros((36, 3), np.uint8)
+        self._diff = np.zeros((36, 3), np.int32)
+        self._fps_buf = np.zeros(30, np.float32)
+        self._fps_i = 0
+        # Farb-Caches: werden nur bei geänderten Parametern neu gebaut
+        self._static_key = None
+        self._static_cache = None
+        self._effect_key = None
+        self._effect_cache = None
         self.preview_frame = None  # Small PIL Image for GUI
         self.preview_enabled = False  # Toggle for CPU saving
         self.last_thumb_time = 0
         self.connected = False
+        self._q = None
+        self._send_thread = None
+        self._timer_res_set = False
 
     def connect(self):
         d = find_device()
@@ -275,12 +401,27 @@ class LedEngine:
         if self.running: return
         if not self.connected and not self.connect(): return
         self.running = True
+        # Pipeline: Capture/Compute-Thread -> Queue -> HID-Sender-Thread.
+        # maxsize=2 hält die Latenz klein, der Produzent verwirft bei
+        # vollem Puffer den ältesten Frame.
+        self._q = queue.Queue(maxsize=2)
         self.thread = threading.Thread(target=self._loop, daemon=True)
+        self._send_thread = threading.Thread(target=self._send_loop, daemon=True)
         self.thread.start()
+        self._send_thread.start()
+        _set_timer_resolution(True)
+        self._timer_res_set = True
 
     def stop(self):
         self.running = False
+        if self._timer_res_set:
+            _set_timer_resolution(False)
+            self._timer_res_set = False
         if self.thread: self.thread.join(timeout=2); self.thread = None
+        if self._send_thread:
+            try: self._q.put_nowait(None)   # Sentinel für den Sender
+            except queue.Full: pass
+            self._send_thread.join(timeout=2); self._send_thread = None
         if self.connected:
             try:
                 # Send "OFF" command multiple times with incrementing counter
@@ -293,90 +434,140 @@ class LedEngine:
             except: pass
 
     def _gen_static(self):
-        r, g, b = self.static_color
-        bri = self.brightness
-        return [(int(r*bri), int(g*bri), int(b*bri))] * 36
+        key = (self.static_color, self.brightness)
+        if key != self._static_key:
+            c = np.asarray(self.static_color, np.float64) * self.brightness
+            self._static_cache = np.broadcast_to(c.astype(np.uint8), (36, 3))
+            self._static_key = key
+        return self._static_cache
+
+    @staticmethod
+    def hsv_u8(h):
+        """Skalar-HSV->RGB (S=V=1) in reiner Ganzzahlarithmetik.
+
+        Hue 0..1 wird auf 6 Sektoren × 256 Stufen quantisiert; ersetzt
+        colorsys.hsv_to_rgb auf den Skalar-Pfaden ohne Float-Branches.
+        Liefert (r, g, b) als 0..255.
+        """
+        i, f = divmod(int((h % 1.0) * 1536), 256)
+        q = 255 - f
+        return ((255, f, 0), (q, 255, 0), (0, 255, f),
+                (0, q, 255), (f, 0, 255), (255, 0, q))[i % 6]
+
+    @staticmethod
+    def _hsv_array(hues, bri):
+        """Vektorisiertes HSV->RGB (S=V=1) für ein Hue-Array, skaliert mit bri.
+
+        Sechs-Sektor-Formel per np.choose statt 36× colorsys pro Frame.
+        Liefert (len(hues), 3) uint8.
+        """
+        h6 = (hues % 1.0) * 6.0
+        i = h6.astype(np.int32) % 6
+        f = h6 - h6.astype(np.int32)
+        p = np.zeros_like(f)
+        q = 1.0 - f
+        one = np.ones_like(f)
+        r = np.choose(i, [one, q, p, p, f, one])
+        g = np.choose(i, [f, one, one, q, p, p])
+        b = np.choose(i, [p, p, f, one, one, q])
+        return (np.stack([r, g, b], axis=1) * (255.0 * bri)).astype(np.uint8)
 
     def _gen_rainbow(self, t):
         speed = self.effect_speed / 50.0
-        bri = self.brightness
-        leds = []
-        for i in range(36):
-            hue = (t * speed * 0.3 + i / 36.0) % 1.0
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            leds.append((int(r*255*bri), int(g*255*bri), int(b*255*bri)))
-        return leds
+        hues = t * speed * 0.3 + self._hue_offsets
+        return self._hsv_array(hues, self.brightness)
 
     def _gen_breathing(self, t):
         speed = self.effect_speed / 50.0
-        bri = self.brightness
         pulse = (math.sin(t * speed * 1.5) + 1.0) / 2.0
-        r, g, b = self.static_color
-        v = pulse * bri
-        return [(int(r*v), int(g*v), int(b*v))] * 36
+        # Puls auf 8 Bit quantisiert: der uint8-Output kann eh nicht feiner
+        # auflösen, und identische Frames greifen im Sender-Frame-Cache
+        key = (self.static_color, self.brightness, int(pulse * 255))
+        if key != self._effect_key:
+            v = (key[2] / 255.0) * self.brightness
+            c = (np.asarray(self.static_color, np.float64) * v).astype(np.uint8)
+            self._effect_cache = np.broadcast_to(c, (36, 3))
+            self._effect_key = key
+        return self._effect_cache
 
     def _gen_cycle(self, t):
         speed = self.effect_speed / 50.0
-        bri = self.brightness
-        hue = (t * speed * 0.1) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return [(int(r*255*bri), int(g*255*bri), int(b*255*bri))] * 36
+        hue_q = int(((t * speed * 0.1) % 1.0) * 1536)   # 6 Sektoren × 256 Stufen
+        key = ("cycle", self.brightness, hue_q)
+        if key != self._effect_key:
+            c = np.asarray(self.hsv_u8(hue_q / 1536.0), np.float64) * self.brightness
+            self._effect_cache = np.broadcast_to(c.astype(np.uint8), (36, 3))
+            self._effect_key = key
+        return self._effect_cache
+
+    @staticmethod
+    def _zone_means(strip, bri_q8, n=12):
+        """Mittelt einen Randstreifen in n Zonen (uint32-Summen, kein float).
+
+        strip: (L, edge, C) — Zonen laufen entlang der ersten Achse,
+        C darf 3 (RGB) oder 4 (BGRA) sein.
+        bri_q8: Helligkeit als 8.8-Fixpunkt (0..256).
+        Liefert (n, C) Zonenfarben im Bereich 0..255.
+        """
+        c = strip.shape[2]
+        if strip.size == 0:
+            return np.zeros((n, c), np.uint64)
+        chunk = strip.shape[0] // n
+        if chunk < 1:
+            # Streifen kleiner als Zonenzahl: eine Farbe für alle Zonen
+            sums = strip.sum(axis=(0, 1), dtype=np.uint32).astype(np.uint64)
+            cnt = strip.shape[0] * strip.shape[1]
+            v = (sums * bri_q8) // (cnt << 8)
+            np.minimum(v, 255, out=v)
+            return np.tile(v, (n, 1))
+        # Erst über die schmale Randachse reduzieren — das läuft direkt auf
+        # der strided View, ohne den Streifen zu materialisieren. Das winzige
+        # (L, C)-Profil wird danach in Zonen geteilt.
+        profile = strip.sum(axis=1, dtype=np.uint32)
+        sums = profile[:n*chunk].reshape(n, chunk, c).sum(axis=1)
+        cnt = chunk * strip.shape[1]
+        v = (sums.astype(np.uint64) * bri_q8) // (cnt << 8)
+        return np.minimum(v, 255, out=v)
 
     def _sample_from_frame(self, frame, bri):
-        """Ultra-fast sampling: optimized slicing + vectorized means."""
+        """Ultra-fast sampling: ein Durchlauf pro Randstreifen, uint32-Summen,
+        Ergebnis landet im wiederverwendeten (36,3)-Puffer.
+
+        Akzeptiert RGB- oder rohe BGRA-Frames; bei BGRA wird die Kanal-
+        reihenfolge erst am winzigen (12,4)-Zonenergebnis gedreht, so dass
+        der Frame-Puffer selbst nie kopiert oder umsortiert werden muss.
+        """
         h, w = frame.shape[:2]
-        cl, ct, cr_, cb = self.crop
-        x0, y0 = int(w * cl), int(h * ct)
-        x1, y1 = max(x0+1, int(w * (1.0 - cr_))), max(y0+1, int(h * (1.0 - cb)))
-
-        # Downsample auf ~360p für Geschwindigkeit
-        scale = max(1, (y1 - y0) // 360)
-        region = frame[y0:y1:scale, x0:x1:scale]
-        rh, rw = region.shape[:2]
-        edge = max(2, int(min(rw, rh) * self.edge_pct))
-        
-        leds = [(0,0,0)] * 36
-
-        def get_zone_colors(img, n, axis):
-            # axis 0 = vertikal teilen (Links/Rechts), axis 1 = horizontal teilen (Oben)
-            if img.size == 0: return [(0,0,0)] * n
-            chunk = img.shape[axis] // n
-            if chunk < 1:
-                m = img.mean(axis=(0, 1))
-                return [(int(m[0]*bri), int(m[1]*bri), int(m[2]*bri))] * n
-            
-            # Vectorized float calculation for precise means
-            img_float = img.astype(np.float32)
-            if axis == 0:
-                # Vertikal: (n, chunk, W, 3) -> mean über (1, 2)
-                res = img_float[:n*chunk].reshape(n, chunk, img.shape[1], 3).mean(axis=(1, 2))
-            else:
-                # Horizontal: (H, n, chunk, 3) -> mean über (0, 2)
-                res = img_float[:, :n*chunk].reshape(img.shape[0], n, chunk, 3).mean(axis=(0, 2))
-            
-            return [(min(255, int(m[0]*bri)), 
-                     min(255, int(m[1]*bri)), 
-                     min(255, int(m[2]*bri))) for m in res]
+        left, top, right = _sampler_geometry(h, w, self.crop, self.edge_pct)
 
-        # 1. Links (unten -> oben)
-        l_strip = region[:, :edge]
-        leds[0:12] = get_zone_colors(l_strip, 12, axis=0)[::-1]
-        
-        # 2. Oben (links -> rechts)
-        t_strip = region[:edge, :]
-        leds[12:24] = get_zone_colors(t_strip, 12, axis=1)
+        out = self._led_out
+        bri_q8 = int(bri * 256)
+        # BGRA -> RGB: Kanäle 2,1,0 auswählen (Alpha fällt weg)
+        ch = slice(2, None, -1) if frame.shape[2] == 4 else slice(None)
 
+        # 1. Links (unten -> oben)
+        out[0:12] = self._zone_means(frame[left], bri_q8)[::-1, ch]
+        # 2. Oben (links -> rechts): transponieren, damit Zonen auf Achse 0 liegen
+        out[12:24] = self._zone_means(frame[top].transpose(1, 0, 2), bri_q8)[:, ch]
         # 3. Rechts (oben -> unten)
-        r_strip = region[:, max(0, rw-edge):]
-        leds[24:36] = get_zone_colors(r_strip, 12, axis=0)
+        out[24:36] = self._zone_means(frame[right], bri_q8)[:, ch]
 
-        return leds
+        return out
 
     def _loop(self):
-        cur = [(0,0,0)] * 36
-        fps_t = []
+        cur = self._cur
+        diff = self._diff
+        cur[:] = 0
+        self._fps_i = 0
         t_start = time.perf_counter()
         sct = None
+        mon = None          # Gecachter Monitor-Dict (mss legt sonst pro Zugriff neu an)
+        mon_idx = -1        # Index, für den `mon` geholt wurde
+        next_t = time.perf_counter()   # Absolute Frame-Deadline
+        last_frame_t = next_t          # Für die Frame-zu-Frame-FPS-Messung
+        overshoot = 0.0                # EWMA: wie viel sleep() typisch zu spät aufwacht
+        cam = None                     # dxcam-Kamera (Desktop Duplication)
+        cam_failed = False             # True -> mss-Fallback benutzen
 
         while self.running:
             t0 = time.perf_counter()
@@ -384,26 +575,49 @@ class LedEngine:
             mode = self.mode
             bri = self.brightness
             alpha = self.smooth
-            mirror = self.mirror
             ft = 1.0 / max(1, self.target_fps)
 
             if mode in ("Ambilight", "🎮 Gaming", "🎬 Film"):
                 frame = None
-                if sct is None:
-                    try:
-                        sct = mss.mss()
-                    except Exception as e:
-                        print(f"MSS Error: {e}")
-                
-                if sct:
-                    try:
-                        mon = sct.monitors[self.monitor_idx]
-                        raw = sct.grab(mon)
-                        # Hyper-fast zero-copy conversion: BGRA -> RGB (via view slicing 2::-1)
-                        # .raw ist schneller als .bgra in vielen Python-Versionen für Buffer
-                        frame = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)[:,:,2::-1]
-                    except:
-                        frame = None
+                # 1) dxcam (Desktop Duplication), wenn installiert und initialisierbar
+                if not cam_failed:
+                    if cam is None:
+                        try:
+                            import dxcam   # lazy: D3D11-Init erst bei Bedarf
+                            cam = dxcam.create(output_idx=max(0, self.monitor_idx - 1),
+                                               output_color="BGRA")
+                        except Exception:
+                            cam = None
+                        if cam is None:
+                            cam_failed = True   # nicht installiert/kein DXGI -> mss
+                    if cam is not None:
+                        try:
+                            # grab() liefert ein BGRA-ndarray ohne CPU-Kopie;
+                            # None heißt "kein neues Bild" -> letzten Frame halten
+                            frame = cam.grab()
+                        except Exception:
+                            cam_failed = True
+                            cam = None
+                # 2) Fallback: mss (GDI BitBlt)
+                if cam_failed:
+                    if sct is None:
+                        try:
+                            import mss
+                            sct = mss.mss()
+                        except Exception as e:
+                            print(f"MSS Error: {e}")
+                    if sct:
+                        try:
+                            if mon is None or mon_idx != self.monitor_idx:
+                                mon = sct.monitors[self.monitor_idx]
+                                mon_idx = self.monitor_idx
+                            raw = sct.grab(mon)
+                            # Zero-copy: roher BGRA-Puffer bleibt C-contiguous,
+                            # der Kanaltausch passiert im Sampler am Zonenergebnis.
+                            # .raw ist schneller als .bgra in vielen Python-Versionen für Buffer
+                            frame = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
+                        except:
+                            frame = None
 
                 if frame is not None:
                     leds = self._sample_from_frame(frame, bri)
@@ -412,9 +626,10 @@ class LedEngine:
                         now = time.perf_counter()
                         if now - self.last_thumb_time > 0.5:
                             try:
+                                from PIL import Image
                                 # Much more aggressive downsampling (stride 32) for "pixelated" look and CPU saving
-                                thumb = frame[::32, ::32]
-                                self.preview_frame = Image.fromarray(thumb)
+                                thumb = frame[::32, ::32, 2::-1]  # BGRA -> RGB erst am Mini-Bild
+                                self.preview_frame = Image.fromarray(np.ascontiguousarray(thumb))
                                 self.last_thumb_time = now
                             except: pass
                     else:
@@ -432,32 +647,102 @@ class LedEngine:
             else:
                 leds = [(0,0,0)] * 36
 
-            f = 1.0 - alpha
-            cur = [(int(c1+(t1-c1)*f), int(c2+(t2-c2)*f), int(c3+(t3-c3)*f))
-                   for (c1,c2,c3),(t1,t2,t3) in zip(cur, leds)]
-
+            # Smoothing als 8.8-Fixpunkt, komplett in-place auf den
+            # persistenten Arrays: cur += (ziel - cur) * (1 - alpha)
+            target = leds if isinstance(leds, np.ndarray) else np.asarray(leds, np.uint8)
+            f_q8 = 256 - max(0, min(256, int(alpha * 256)))
+            if f_q8 >= 256:
+                np.copyto(cur, target)    # Smoothing aus: Ziel direkt übernehmen
+            elif f_q8 > 0:
+                np.copyto(diff, target)   # uint8 -> int32, dann vorzeichenbehaftet rechnen
+                diff -= cur
+                diff *= f_q8
+                diff >>= 8
+                diff += cur
+                np.copyto(cur, diff, casting="unsafe")   # Werte sind sicher 0..255
+            # f_q8 == 0: Farbe einfrieren — cur bleibt unverändert
+
+            # Kopie an Sender + GUI übergeben (cur wird nächsten Frame in-place
+            # überschrieben); bei voller Queue den ältesten Frame verwerfen
+            frame_out = cur.copy()
             try:
-                build_and_send(self.out, cur, self.cnt, mirror)
-                self.cnt = (self.cnt + 1) & 0xFF
-            except:
-                self.running = False; break
-
-            self.current_leds = list(cur)
-            elapsed = time.perf_counter() - t0
-            fps_t.append(elapsed)
-            if len(fps_t) > 30: fps_t.pop(0)
-            avg_t = sum(fps_t)/len(fps_t)
+                self._q.put_nowait(frame_out)
+            except queue.Full:
+                try: self._q.get_nowait()
+                except queue.Empty: pass
+                try: self._q.put_nowait(frame_out)
+                except queue.Full: pass
+
+            self.current_leds = frame_out
+            # Frame-zu-Frame-Zeit messen (seit der Sender parallel läuft, wäre
+            # die reine Rechenzeit als FPS-Anzeige irreführend hoch)
+            now = time.perf_counter()
+            self._fps_buf[self._fps_i % 30] = now - last_frame_t
+            last_frame_t = now
+            self._fps_i += 1
+            avg_t = float(self._fps_buf[:min(self._fps_i, 30)].mean())
             self.actual_fps = 1.0 / max(0.001, avg_t)
-            
-            wait = ft - elapsed
+
+            # Absolute Deadline statt relativem Sleep: Wakeup-Jitter
+            # akkumuliert sich so nicht zu FPS-Drift
+            next_t += ft
+            wait = next_t - time.perf_counter()
             if wait > 0:
-                time.sleep(wait)
+                # Typischen Scheduler-Overshoot vorhalten: etwas kürzer
+                # schlafen, als die Deadline verlangt, und die tatsächliche
+                # Verspätung per EWMA nachführen
+                req = max(0.0, wait - overshoot)
+                t_sleep = time.perf_counter()
+                if req > 0:
+                    time.sleep(req)
+                overshoot += 0.1 * ((time.perf_counter() - t_sleep) - req - overshoot)
+                overshoot = min(max(overshoot, 0.0), ft)
+            elif wait < -ft:
+                next_t = time.perf_counter()   # zu weit hinterher: neu aufsetzen
 
         # Cleanup
+        try: self._q.put_nowait(None)   # Sender sauber beenden
+        except queue.Full: pass
+        if cam:
+            try: cam.release()
+            except: pass
         if sct:
             try: sct.close()
             except: pass
 
+    def _send_loop(self):
+        """Verbraucher: schiebt fertige Frames per HID raus.
+
+        Läuft parallel zum Capture-Thread, damit die 3 blockierenden
+        HID-Writes die nächste Bildschirmaufnahme nicht aufhalten.
+        Unveränderte Frames werden übersprungen (Statisch/Standbild kostet
+        dann keinen Bus-Traffic); alle 0.5 s geht trotzdem ein Keepalive
+        raus, damit die Hardware nicht in den Timeout läuft.
+        """
+        last_sent = None
+        last_send_t = 0.0
+        while True:
+            try:
+                cur = self._q.get(timeout=0.5)
+            except queue.Empty:
+                if not self.running: break
+                continue
+            if cur is None:
+                break
+            data = cur.tobytes()   # 108 Bytes — billiger als 3 HID-Writes
+            now = time.perf_counter()
+            if data == last_sent and now - last_send_t < 0.5:
+                continue
+            try:
+                build_and_send(self.out, cur, self.cnt, self.mirror)
+                self.cnt = (self.cnt + 1) & 0xFF
+                last_sent = data
+                last_send_t = now
+            except:
+                # USB weg -> ganze Engine stoppen, GUI zeigt "Verbindung verloren"
+                self.running = False
+                break
+
 
 # =============================================================================
 # GUI
@@ -472,10 +757,11 @@ class AmbilightGUI:
         self.root.configure(bg=BG)
         self.root.resizable(False, False)
         
-        # Monitor Dimensionen holen
-        with mss.mss() as sct:
-            mon = sct.monitors[1]
-            self.mon_w, self.mon_h = mon["width"], mon["height"]
+        # Monitor-Dimensionen vom schon laufenden Tk holen — erspart es,
+        # beim GUI-Start nur dafür mss (Win32-COM-Init) hochzufahren.
+        # Entspricht monitors[1] (Primärmonitor), den auch die Engine nutzt.
+        self.mon_w = self.root.winfo_screenwidth()
+        self.mon_h = self.root.winfo_screenheight()
 
         # GUI Variablen initialisieren
         self.mode_var = tk.StringVar(value="Ambilight")
@@ -494,11 +780,24 @@ class AmbilightGUI:
         self.autostart_win_var = tk.BooleanVar(value=False)
         self.autostart_mode_var = tk.BooleanVar(value=False)
 
+        # Netto-Kosten der letzten GUI-Ticks für die adaptive after()-Pause
+        self._tick_costs = deque(maxlen=200)
+        # Zuletzt gesetzte Widget-Optionen, um redundante configure()s zu sparen
+        self._last_wstate = {}
+        self.tray_icon = None
+        self._tk_preview_img = None  # Keep reference
+        self._prev_frame_src = None   # Identität des zuletzt gerenderten Thumbnails
+        self._prev_frame_size = None  # (tw, th_inner) des PhotoImage
+        self._aspect_flush_id = None  # ausstehender after_idle für Crop-Drag
+        self._window_visible = True   # False solange ins Tray minimiert
+        self._hex_cache = {}  # (r<<16)|(g<<8)|b -> "#rrggbb"
+        self._prev_engine_state = {}  # zuletzt an die Engine geschriebene Werte
+
         self._build_ui()
+        self._register_var_traces()
         self._apply_config()
         self._update_loop()
-        self.tray_icon = None
-        self._tk_preview_img = None  # Keep reference
+        self._preview_tick()
 
         if self.cfg.get("autostart_mode", False):
             self.root.after(500, self._auto_start)
@@ -540,9 +839,9 @@ class AmbilightGUI:
         self.autostart_mode_var.set(cfg.get("autostart_mode", False))
         col = cfg.get("color", [255, 0, 80])
         self.engine.static_color = tuple(col)
-        hexc = f"#{col[0]:02x}{col[1]:02x}{col[2]:02x}"
-        self.color_btn.configure(bg=hexc)
-        self.color_hex_label.configure(text=hexc.upper())
+        hexc = _rgb_to_hex(tuple(col))
+        self._wconfig(self.color_btn, bg=hexc)
+        self._wconfig(self.color_hex_label, text=hexc.upper())
         self._on_mode_change()
         self._on_aspect_change()
 
@@ -568,6 +867,20 @@ class AmbilightGUI:
             "autostart_mode": self.autostart_mode_var.get(),
         }
 
+    def _wconfig(self, widget, **kw):
+        """configure() nur mit tatsächlich geänderten Optionen aufrufen.
+
+        Jeder Tk-Roundtrip kostet ein Vielfaches des Dict-Vergleichs; die
+        periodischen Ticks laufen sonst 7+ redundante configures pro Durchlauf.
+        Alle Text/Farb-Updates der Statuswidgets müssen über diesen Helfer
+        gehen, damit der Cache konsistent bleibt.
+        """
+        prev = self._last_wstate.setdefault(id(widget), {})
+        changed = {k: v for k, v in kw.items() if prev.get(k) != v}
+        if changed:
+            widget.configure(**changed)
+            prev.update(changed)
+
     def _card(self, parent, title, icon=""):
         frame = tk.Frame(parent, bg=BG_CARD, bd=0, highlightbackground=BORDER,
                          highlightthickness=1, padx=12, pady=8)
@@ -638,6 +951,7 @@ class AmbilightGUI:
 
         # ---- Modus Card ----
         card_mode = self._card(main, "Modus", "🎨")
+        self._card_mode = card_mode  # Anker für das Ein-/Aussortieren der Ambilight-Karte
 
         mode_row = tk.Frame(card_mode, bg=BG_CARD)
         mode_row.pack(fill="x")
@@ -752,6 +1066,7 @@ class AmbilightGUI:
         self.canvas.pack(fill="x", pady=(2,6))
         self.canvas.bind("<B1-Motion>", self._on_canvas_drag)
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        self.canvas.bind("<Configure>", self._relayout_preview)
 
     # ---- Callbacks ----
 
@@ -766,27 +1081,24 @@ class AmbilightGUI:
             self.fps_var.set(fps_p)
             self.edge_var.set(edge_p)
 
-        # Ambilight-Karte bei allen Capture-Modi zeigen
+        # Ambilight-Karte bei allen Capture-Modi zeigen — direkt hinter der
+        # Modus-Karte, deren Referenz _build_ui gemerkt hat (erspart den
+        # winfo_children()-Scan samt magischem Index)
         if mode in ("Ambilight", "🎮 Gaming", "🎬 Film"):
-            self.ambi_card.pack(fill="x", pady=(0,5))
-            try:
-                children = self.ambi_card.master.winfo_children()
-                mode_card_idx = 2  # After header area + status + mode card
-                self.ambi_card.pack_configure(after=children[mode_card_idx])
-            except: pass
+            self.ambi_card.pack(fill="x", pady=(0,5), after=self._card_mode)
         else:
             self.ambi_card.pack_forget()
 
     def _pick_color(self):
         r, g, b = self.engine.static_color
-        initial = f"#{r:02x}{g:02x}{b:02x}"
+        initial = _rgb_to_hex((r, g, b))
         result = colorchooser.askcolor(color=initial, title="LED-Farbe wählen")
         if result and result[0]:
             rgb = tuple(int(c) for c in result[0])
             self.engine.static_color = rgb
-            hexc = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-            self.color_btn.configure(bg=hexc)
-            self.color_hex_label.configure(text=hexc.upper())
+            hexc = _rgb_to_hex(rgb)
+            self._wconfig(self.color_btn, bg=hexc)
+            self._wconfig(self.color_hex_label, text=hexc.upper())
 
     def _on_aspect_change(self, event=None):
         name = self.aspect_var.get()
@@ -794,7 +1106,7 @@ class AmbilightGUI:
             self.manual_crop_frame.pack(fill="x", pady=(2,0))
             crop = (self.crop_l_var.get()/100.0, self.crop_t_var.get()/100.0,
                     self.crop_r_var.get()/100.0, self.crop_b_var.get()/100.0)
-            self.crop_label.configure(text="→ Manuelle Einstellung / Maus")
+            self._wconfig(self.crop_label, text="→ Manuelle Einstellung / Maus")
             self.engine.preview_enabled = self.preview_show_var.get()
         else:
             self.manual_crop_frame.pack_forget()
@@ -802,17 +1114,18 @@ class AmbilightGUI:
             aspect = ASPECT_RATIOS.get(name)
             crop = calc_region(self.mon_w, self.mon_h, aspect)
             if aspect is None:
-                self.crop_label.configure(text="→ Gesamter Bildschirm")
+                self._wconfig(self.crop_label, text="→ Gesamter Bildschirm")
             else:
                 lr_px = int(self.mon_w * crop[0])
                 tb_px = int(self.mon_h * crop[1])
                 if lr_px > 0:
-                    self.crop_label.configure(text=f"→ je {lr_px}px links/rechts")
+                    self._wconfig(self.crop_label, text=f"→ je {lr_px}px links/rechts")
                 elif tb_px > 0:
-                    self.crop_label.configure(text=f"→ je {tb_px}px oben/unten")
+                    self._wconfig(self.crop_label, text=f"→ je {tb_px}px oben/unten")
                 else:
-                    self.crop_label.configure(text="→ passt bereits")
+                    self._wconfig(self.crop_label, text="→ passt bereits")
         self.engine.crop = crop
+        self._prev_engine_state["crop"] = crop  # Cache für _update_loop aktuell halten
 
     def _on_canvas_click(self, event):
         if self.aspect_var.get() != "Manuell": return
@@ -843,112 +1156,242 @@ class AmbilightGUI:
         self.crop_r_var.set(int(nr))
         self.crop_t_var.set(int(nt))
         self.crop_b_var.set(int(nb))
+        # Maus-Events kommen mit bis zu 120 Hz rein — das Layout-/Label-
+        # Update per after_idle koaleszieren, statt es pro Pixel zu feuern
+        if self._aspect_flush_id is None:
+            self._aspect_flush_id = self.root.after_idle(self._flush_aspect_change)
+
+    def _flush_aspect_change(self):
+        self._aspect_flush_id = None
         self._on_aspect_change()
 
     def _toggle(self):
         if self.engine.running:
             self.engine.stop()
-            self.start_btn.configure(text="▶  S T A R T", bg=ACCENT2)
-            self.status_label.configure(text="● Gestoppt", fg=RED)
+            self._wconfig(self.start_btn, text="▶  S T A R T", bg=ACCENT2)
+            self._wconfig(self.status_label, text="● Gestoppt", fg=RED)
         else:
             if not self.engine.connected:
                 if not self.engine.connect():
-                    self.status_label.configure(text="● Kein Gerät gefunden!", fg=RED)
+                    self._wconfig(self.status_label, text="● Kein Gerät gefunden!", fg=RED)
                     return
             self.engine.start()
-            self.start_btn.configure(text="⏹  S T O P", bg="#da3633")
-            self.status_label.configure(text=f"● {self.mode_var.get()}", fg=ACCENT2)
+            self._wconfig(self.start_btn, text="⏹  S T O P", bg="#da3633")
+            self._wconfig(self.status_label, text=f"● {self.mode_var.get()}", fg=ACCENT2)
 
     def _toggle_autostart(self):
         set_autostart(self.autostart_win_var.get())
 
-    def _update_loop(self):
-        self.engine.brightness = self.bri_var.get() / 100.0
-        self.engine.smooth = self.smooth_var.get() / 100.0
-        self.engine.target_fps = self.fps_var.get()
-        self.engine.edge_pct = self.edge_var.get() / 100.0
-        self.engine.mirror = self.mirror_var.get()
-        self.engine.mode = self.mode_var.get()
-        self.engine.effect_speed = self.speed_var.get()
-
-        if self.aspect_var.get() == "Manuell":
-            self.engine.crop = (self.crop_l_var.get()/100.0, self.crop_t_var.get()/100.0,
-                                self.crop_r_var.get()/100.0, self.crop_b_var.get()/100.0)
-
-        for var in (self.bri_var, self.smooth_var, self.fps_var, self.edge_var, self.speed_var, 
-                    self.crop_l_var, self.crop_r_var, self.crop_t_var, self.crop_b_var):
-            if hasattr(var, '_label'):
-                var._label.configure(text=f"{var.get()}{var._suffix}")
+    # Zwei getrennte GUI-Ticks: Parameter-Sync bei ~20 Hz, Preview bei max.
+    # ~30 FPS. Die Engine darf 120+ FPS an die LEDs schicken, aber die
+    # Canvas schneller als das Display zu rendern wäre verschenkte Arbeit.
+    _TICK_MS = 50
+    _PREVIEW_MS = 33
+
+    def _register_var_traces(self):
+        """Push-Modell statt Polling: Die Tk-Variablen melden Änderungen per
+        trace selbst an die Engine (und aktualisieren ihr Slider-Label),
+        statt dass der 50-ms-Tick jedes Mal ein Dutzend get()s macht."""
+        engine_vars = (
+            (self.bri_var,    "brightness",   lambda v: v / 100.0),
+            (self.smooth_var, "smooth",       lambda v: v / 100.0),
+            (self.fps_var,    "target_fps",   None),
+            (self.edge_var,   "edge_pct",     lambda v: v / 100.0),
+            (self.mirror_var, "mirror",       None),
+            (self.mode_var,   "mode",         None),
+            (self.speed_var,  "effect_speed", None),
+        )
+        for var, attr, scale in engine_vars:
+            var.trace_add("write", lambda *_, v=var, a=attr, s=scale:
+                          self._on_var_write(v, a, s))
+        for var in (self.crop_l_var, self.crop_t_var,
+                    self.crop_r_var, self.crop_b_var):
+            var.trace_add("write", lambda *_, v=var:
+                          (self._on_var_write(v), self._sync_manual_crop()))
+        # Initialwerte einmal explizit durchreichen
+        for var, attr, scale in engine_vars:
+            self._on_var_write(var, attr, scale)
+        self._sync_manual_crop()
+
+    def _on_var_write(self, var, attr=None, scale=None):
+        try:
+            v = var.get()
+        except tk.TclError:
+            return
+        if hasattr(var, "_label"):
+            self._wconfig(var._label, text=f"{v}{var._suffix}")
+        if attr is not None:
+            self._sync_engine_field(attr, scale(v) if scale else v)
+
+    def _sync_engine_field(self, attr, value):
+        """Engine-Attribut nur bei tatsächlicher Änderung schreiben."""
+        if self._prev_engine_state.get(attr) != value:
+            setattr(self.engine, attr, value)
+            self._prev_engine_state[attr] = value
+
+    def _sync_manual_crop(self):
+        if self.aspect_var.get() != "Manuell":
+            return
+        self._sync_engine_field("crop",
+                                (self.crop_l_var.get()/100.0, self.crop_t_var.get()/100.0,
+                                 self.crop_r_var.get()/100.0, self.crop_b_var.get()/100.0))
 
+    def _update_loop(self):
+        if not self.engine.running and "STOP" in self.start_btn.cget("text"):
+            self._wconfig(self.start_btn, text="▶  S T A R T", bg=ACCENT2)
+            self._wconfig(self.status_label, text="● Verbindung verloren", fg=RED)
+
+        self.root.after(self._TICK_MS, self._update_loop)
+
+    def _preview_tick(self):
+        if not self._window_visible:
+            # Im Tray versteckt: keine Canvas-Arbeit für ein unsichtbares
+            # Fenster — nur den Tick auf kleiner Flamme weiterlaufen lassen
+            self.root.after(500, self._preview_tick)
+            return
+        t_tick = time.perf_counter()
         if self.engine.running:
-            self.fps_label.configure(text=f"{self.engine.actual_fps:.0f} FPS", fg=ACCENT)
+            self._wconfig(self.fps_label, text=f"{self.engine.actual_fps:.0f} FPS", fg=ACCENT)
         else:
-            self.fps_label.configure(text="— FPS", fg=FG_DIM)
+            self._wconfig(self.fps_label, text="— FPS", fg=FG_DIM)
 
         self._draw_preview()
 
-        if not self.engine.running and "STOP" in self.start_btn.cget("text"):
-            self.start_btn.configure(text="▶  S T A R T", bg=ACCENT2)
-            self.status_label.configure(text="● Verbindung verloren", fg=RED)
+        # Alle configure-/itemconfigure-Aufrufe dieses Ticks in einem Rutsch
+        # rendern lassen, statt die Redraws als einzelne Idle-Tasks über
+        # den nächsten Event-Loop-Durchlauf zu verteilen
+        self.root.update_idletasks()
 
-        self.root.after(50, self._update_loop)
+        # Adaptive Pause: Arbeitszeit des Ticks vom Zielintervall abziehen,
+        # damit die reale Tick-Rate nicht mit der Renderlast wegdriftet
+        self._tick_costs.append(time.perf_counter() - t_tick)
+        avg_ms = sum(self._tick_costs) / len(self._tick_costs) * 1000.0
+        self.root.after(max(1, int(self._PREVIEW_MS - avg_ms)), self._preview_tick)
 
-    def _draw_preview(self):
+    def _relayout_preview(self, event=None):
+        """Canvas-Items einmalig anlegen und ihre Geometrie (neu) setzen.
+
+        Läuft nur beim ersten Zeichnen und bei <Configure> (Resize) —
+        der Tick selbst ändert dann nur noch Füllfarben statt 40 Items
+        pro Durchlauf zu löschen und neu anzulegen."""
         c = self.canvas
-        c.delete("all")
         w = c.winfo_width() or 400
         h = c.winfo_height() or 55
-        
+
         pad, lw = 3, 12
         tx0, tx1 = pad+lw+2, w-pad-lw-2
         ty0, ty1 = pad+lw+2, h-pad-2
         tw = tx1 - tx0
         th_inner = ty1 - ty0
 
-        # Hintergrund: Live-Bild vom Monitor im Inhaltsbereich
-        if self.engine.preview_frame:
-            try:
-                # Resize thumbnail for the inner content area
-                img = self.engine.preview_frame.resize((tw, th_inner), Image.NEAREST)
-                self._tk_preview_img = ImageTk.PhotoImage(img)
-                c.create_image(tx0, ty0, image=self._tk_preview_img, anchor="nw")
-            except: pass
-        
-        leds = self.engine.current_leds
-        # LEDs zeichnen (drüber)
+        if not hasattr(self, "_rect_ids"):
+            c_color = "#00f0ff"
+            self._prev_img_id = c.create_image(0, 0, anchor="nw")
+            self._rect_ids = [c.create_rectangle(0, 0, 0, 0, outline="",
+                                                 tags=("led",))
+                              for _ in range(3 * N)]
+            self._rect_fill = [None] * (3 * N)
+            self._uniform_hex = None  # Hex-Wert, falls zuletzt alle LEDs gleich
+            self._crop_rect_id = c.create_rectangle(0, 0, 0, 0, outline=c_color,
+                                                    dash=(2, 2), width=1,
+                                                    state="hidden")
+            self._crop_text_id = c.create_text(0, 0, text="CAPTURE AREA",
+                                               fill=c_color,
+                                               font=("Segoe UI", 7, "bold"),
+                                               state="hidden")
+
+        c.coords(self._prev_img_id, tx0, ty0)
+        rx = w-pad-lw
         for i in range(N):
             y0_led = pad + int((h-2*pad)*i/N)
             y1_led = pad + int((h-2*pad)*(i+1)/N) - 1
-            r, g, b = leds[11-i]
-            c.create_rectangle(pad, y0_led, pad+lw, y1_led,
-                               fill=f"#{r:02x}{g:02x}{b:02x}", outline="")
-            
+            c.coords(self._rect_ids[i], pad, y0_led, pad+lw, y1_led)
+            c.coords(self._rect_ids[24+i], rx, y0_led, rx+lw, y1_led)
         for i in range(N):
             x0_led = tx0 + int(tw*i/N)
             x1_led = tx0 + int(tw*(i+1)/N) - 1
-            r, g, b = leds[12+i]
-            c.create_rectangle(x0_led, pad, x1_led, pad+lw,
-                               fill=f"#{r:02x}{g:02x}{b:02x}", outline="")
-            
-        rx = w-pad-lw
-        for i in range(N):
-            y0_led = pad + int((h-2*pad)*i/N)
-            y1_led = pad + int((h-2*pad)*(i+1)/N) - 1
-            r, g, b = leds[24+i]
-            c.create_rectangle(rx, y0_led, rx+lw, y1_led,
-                               fill=f"#{r:02x}{g:02x}{b:02x}", outline="")
-                               
+            c.coords(self._rect_ids[12+i], x0_led, pad, x1_led, pad+lw)
+        c.coords(self._crop_text_id, (tx0+tx1)//2, (ty0+ty1)//2)
+
+        self._prev_geom = (tx0, ty0, tx1, ty1, tw, th_inner)
+        self._crop_drawn = None  # Crop-Rahmen neu positionieren
+
+    def _draw_preview(self):
+        c = self.canvas
+        if not hasattr(self, "_rect_ids"):
+            self._relayout_preview()
+        tx0, ty0, tx1, ty1, tw, th_inner = self._prev_geom
+
+        # Hintergrund: Live-Bild vom Monitor im Inhaltsbereich. Die Engine
+        # erneuert das Thumbnail nur ~2x/s — PhotoImage deshalb nur bei
+        # neuem Bild anfassen und wenn möglich in-place per paste()
+        # aktualisieren, statt pro Tick ein frisches Tk-Handle anzulegen
+        pf = self.engine.preview_frame
+        if pf is not None:
+            if pf is not self._prev_frame_src or (tw, th_inner) != self._prev_frame_size:
+                try:
+                    from PIL import Image, ImageTk
+                    img = pf.resize((tw, th_inner), Image.NEAREST)
+                    if self._tk_preview_img is not None and (tw, th_inner) == self._prev_frame_size:
+                        self._tk_preview_img.paste(img)
+                    else:
+                        self._tk_preview_img = ImageTk.PhotoImage(img)
+                        c.itemconfigure(self._prev_img_id, image=self._tk_preview_img)
+                    self._prev_frame_src = pf
+                    self._prev_frame_size = (tw, th_inner)
+                except: pass
+        elif self._tk_preview_img is not None:
+            self._tk_preview_img = None
+            self._prev_frame_src = None
+            self._prev_frame_size = None
+            c.itemconfigure(self._prev_img_id, image="")
+
+        leds = self.engine.current_leds.tolist()
+        rect_ids, rect_fill = self._rect_ids, self._rect_fill
+        hex_cache = self._hex_cache
+        if len(hex_cache) > 4096:
+            hex_cache.clear()
+        # Schnellpfad: alle LEDs gleichfarbig (Statisch/Breathing/Cycle) —
+        # ein Broadcast-configure über das "led"-Tag statt 36 Einzelaufrufe
+        if leds.count(leds[0]) == 3 * N:
+            r, g, b = leds[0]
+            key = (r << 16) | (g << 8) | b
+            hexc = hex_cache.get(key)
+            if hexc is None:
+                hexc = hex_cache[key] = "#%06x" % key
+            if self._uniform_hex != hexc:
+                c.itemconfigure("led", fill=hexc)
+                rect_fill[:] = [hexc] * (3 * N)
+                self._uniform_hex = hexc
+        else:
+            self._uniform_hex = None
+            # LEDs: nur Items mit geänderter Farbe anfassen (itemconfigure
+            # ist der teuerste Teil des Ticks, die Farben sind meist stabil)
+            for i in range(3 * N):
+                r, g, b = leds[11-i if i < N else i]
+                key = (r << 16) | (g << 8) | b
+                hexc = hex_cache.get(key)
+                if hexc is None:
+                    hexc = hex_cache[key] = "#%06x" % key
+                if rect_fill[i] != hexc:
+                    c.itemconfigure(rect_ids[i], fill=hexc)
+                    rect_fill[i] = hexc
+
         # Visueller Crop-Rahmen
         cl, ct, cr, cb = self.engine.crop
-        if cl > 0 or ct > 0 or cr > 0 or cb > 0:
-            cx0 = tx0 + int(tw * cl)
-            cy0 = ty0 + int(th_inner * ct)
-            cx1 = tx1 - int(tw * cr)
-            cy1 = ty1 - int(th_inner * cb)
-            # Brighter color for visibility on background
-            c_color = "#00f0ff"
-            c.create_rectangle(cx0, cy0, cx1, cy1, outline=c_color, dash=(2,2), width=1)
-            c.create_text((tx0+tx1)//2, (ty0+ty1)//2, text="CAPTURE AREA", fill=c_color, font=("Segoe UI", 7, "bold"))
+        if (cl, ct, cr, cb) != self._crop_drawn:
+            self._crop_drawn = (cl, ct, cr, cb)
+            if cl > 0 or ct > 0 or cr > 0 or cb > 0:
+                cx0 = tx0 + int(tw * cl)
+                cy0 = ty0 + int(th_inner * ct)
+                cx1 = tx1 - int(tw * cr)
+                cy1 = ty1 - int(th_inner * cb)
+                c.coords(self._crop_rect_id, cx0, cy0, cx1, cy1)
+                c.itemconfigure(self._crop_rect_id, state="normal")
+                c.itemconfigure(self._crop_text_id, state="normal")
+            else:
+                c.itemconfigure(self._crop_rect_id, state="hidden")
+                c.itemconfigure(self._crop_text_id, state="hidden")
 
     def run(self):
         self.root.protocol("WM_DELETE_WINDOW", self._minimize_to_tray)
@@ -958,6 +1401,7 @@ class AmbilightGUI:
 
     def _create_tray_icon_image(self):
         """Erstellt ein kleines farbiges Icon für den Tray."""
+        from PIL import Image, ImageDraw
         img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         # Farbiger Kreis mit Accent-Farbe
@@ -968,8 +1412,10 @@ class AmbilightGUI:
 
     def _minimize_to_tray(self):
         """Fenster verstecken und ins System-Tray minimieren."""
+        self._window_visible = False
         self.root.withdraw()
         if self.tray_icon is None:
+            import pystray
             menu = pystray.Menu(
                 pystray.MenuItem("Öffnen", self._tray_restore, default=True),
                 pystray.MenuItem("Beenden", self._tray_quit)
@@ -984,6 +1430,7 @@ class AmbilightGUI:
 
     def _tray_restore(self, icon=None, item=None):
         """Fenster aus dem Tray wiederherstellen."""
+        self._window_visible = True
         self.root.after(0, self.root.deiconify)
 
     def _tray_quit(self, icon=None, item=None):
@@ -21,7 +21,7 @@ Verwendung:
 import sys
 import time
 import math
-import colorsys
+import numpy as np
 import pywinusb.hid as hid
 
 VID = 0x1A86
@@ -34,13 +34,74 @@ TOTAL_LEDS = NUM_LEDS_PER_GROUP * NUM_GROUPS  # 36
 HEADER = bytes([0x53, 0x43, 0x00, 0xB1, 0xBF, 0x80, 0x01])
 BUFFER_SIZE = 192
 
+# --- Vorberechnete Puffer-Geometrie (gleiches Schema wie in ambilight.py) ----
+# Protokoll-Slots wie im C++-Original: all_leds[0] separat, dann drei
+# 12er-Blöcke ab Index 1, 12, 24 (Index 12 wird dadurch doppelt gesendet).
+_SLOT_SRC = [0] + list(range(1, 13)) + list(range(12, 24)) + list(range(24, 36))
+# LED-Index -> Protokollreihenfolge: links läuft rückwärts, oben/rechts normal
+_ORDER = list(range(12))[::-1] + list(range(12, 36))
+_TAKE = np.array([_ORDER[s] for s in _SLOT_SRC], np.intp)
+# Byte-Positionen der Farbwerte im 192er-Puffer (erste LED ab 7, dann 3 Bytes
+# je 5-Byte-Slot ab Offset 10)
+_COLOR_POS = np.array([7, 8, 9] + [10 + 5*k + c for k in range(36) for c in (2, 3, 4)],
+                      np.intp)
+# Template mit Header und den deterministischen Zähler-Bytes (0x01..0x48)
+_BUF_TEMPLATE = bytearray(BUFFER_SIZE)
+_BUF_TEMPLATE[0:7] = HEADER
+_c = 1
+for _k in range(36):
+    _BUF_TEMPLATE[10 + 5*_k] = _c & 0xFF; _c += 1
+    _BUF_TEMPLATE[10 + 5*_k + 1] = _c & 0xFF; _c += 1
+del _c, _k
+
+# Basis-Hues für den Regenbogen (eine Umdrehung über alle LEDs)
+_HUE_BASE = np.arange(TOTAL_LEDS, dtype=np.float32) / TOTAL_LEDS
+
+
+def _hsv_ramp(hues):
+    """Vektorisiertes HSV->RGB (S=V=1) für ein Hue-Array.
+
+    Sechs-Sektor-Formel per np.choose statt colorsys pro LED;
+    liefert (len(hues), 3) uint8.
+    """
+    h6 = (hues % 1.0) * 6.0
+    i = h6.astype(np.int32) % 6
+    f = h6 - h6.astype(np.int32)
+    p = np.zeros_like(f)
+    q = 1.0 - f
+    one = np.ones_like(f)
+    r = np.choose(i, [one, q, p, p, f, one])
+    g = np.choose(i, [f, one, one, q, p, p])
+    b = np.choose(i, [p, p, f, one, one, q])
+    return (np.stack([r, g, b], axis=1) * 255.0).astype(np.uint8)
+
+
+# Regenbogen-LUT für die Animationen: Hue 0..1 auf 1024 Stufen vorgerechnet
+_HUE_LUT = _hsv_ramp(np.arange(1024, dtype=np.float32) / 1024.0)
+
+# Tick der Animations-Schleifen (ehemals sleep(0.03) pro Frame)
+_FRAME_TIME = 1.0 / 30.0
+
 
 class DXLightController:
+    # Feste Attributliste: spart das Instanz-Dict und macht die
+    # Attribut-Lookups in den heißen Pfaden billiger
+    __slots__ = ("device", "output_report", "counter", "leds",
+                 "_buf", "_buf_np", "_buf_mv", "_report")
+
     def __init__(self):
         self.device = None
         self.output_report = None
         self.counter = 0
-        self.leds = [(0, 0, 0)] * TOTAL_LEDS  # (R, G, B) per LED
+        # (R, G, B) je LED als uint8-Array — set_all/set_group/Helligkeit
+        # werden damit zu Broadcast-Zuweisungen statt Listen-Neuaufbau
+        self.leds = np.zeros((TOTAL_LEDS, 3), np.uint8)
+        # Wiederverwendeter Sendepuffer, aus dem Template vorbefüllt
+        self._buf = bytearray(_BUF_TEMPLATE)
+        self._buf_np = np.frombuffer(self._buf, np.uint8)
+        self._buf_mv = memoryview(self._buf)
+        # 65-Byte Report (Report-ID 0x00 + 64 Datenbytes), wiederverwendet
+        self._report = bytearray(65)
 
     def connect(self):
         """Verbindet sich mit dem DX-Light Strip."""
@@ -75,82 +136,36 @@ class DXLightController:
             print("Getrennt.")
 
     def _build_buffer(self):
-        """Baut den 192-Byte Puffer aus dem aktuellen LED-Zustand.
-        
-        Das C++ Original legt die 3 LED-Arrays zusammenhängend im Speicher:
-          dataLed1[0..11], dataLed2[0..11], dataLed3[0..11]
-        und schreibt dann:
-          1) dataLed1[0] separat (3 Bytes)
-          2) Block ab dataLed1[1] für 12 LEDs (liest in dataLed2 hinein)
-          3) Block ab dataLed2[0] für 12 LEDs
-          4) Block ab dataLed3[0] für 12 LEDs
-        Wir replizieren das, indem wir alle LEDs konkatinieren.
+        """Patcht den wiederverwendeten 192-Byte Puffer mit dem LED-Zustand.
+
+        Das C++ Original legt die 3 LED-Arrays zusammenhängend im Speicher
+        (links umgekehrt, oben und rechts normal) und schreibt dataLed1[0]
+        separat, dann drei 12er-Blöcke ab Index 1, 12 und 24 (Index 12
+        doppelt). Diese feste Slot-Reihenfolge steckt in _TAKE, die
+        Zähler-Bytes stehen schon im Template — pro Aufruf bleiben nur der
+        Frame-Zähler und die 37 RGB-Tripel zu schreiben.
         """
-        buf = bytearray(BUFFER_SIZE)
-
-        # Header (7 Bytes)
-        buf[0:7] = HEADER
-        buf[4] = self.counter & 0xFF
+        self._buf[4] = self.counter & 0xFF
         self.counter = (self.counter + 1) & 0xFF
-
-        # Gruppen aufbauen (wie im C++: left reversed, top normal, right normal)
-        left_leds = list(reversed(self.leds[0:12]))
-        top_leds = list(self.leds[12:24])
-        right_leds = list(self.leds[24:36])
-
-        # Alle zusammenhängend (wie C++ Stack-Layout)
-        all_leds = left_leds + top_leds + right_leds  # 36 entries
-
-        ptr = 7
-
-        # Erste LED separat (3 Bytes: R, G, B)
-        r, g, b = all_leds[0]
-        buf[ptr] = r & 0xFF
-        buf[ptr + 1] = g & 0xFF
-        buf[ptr + 2] = b & 0xFF
-        ptr += 3
-
-        # LED Counter für die Blöcke
-        led_counter = 0x01
-
-        # Block-Schreibfunktion: 12 LEDs × 5 Bytes (2 counter + R + G + B)
-        def write_block(start_idx):
-            nonlocal ptr, led_counter
-            for i in range(12):
-                buf[ptr] = led_counter & 0xFF
-                led_counter += 1
-                buf[ptr + 1] = led_counter & 0xFF
-                led_counter += 1
-                r, g, b = all_leds[start_idx + i]
-                buf[ptr + 2] = r & 0xFF
-                buf[ptr + 3] = g & 0xFF
-                buf[ptr + 4] = b & 0xFF
-                ptr += 5
-
-        # Block 1: ab Index 1 (left_leds[1..11] + top_leds[0])
-        write_block(1)
-        # Block 2: ab Index 12 (top_leds[0..11])
-        write_block(12)
-        # Block 3: ab Index 24 (right_leds[0..11])
-        write_block(24)
-
-        return buf
+        a = np.asarray(self.leds, np.uint8).take(_TAKE, axis=0)
+        self._buf_np[_COLOR_POS] = a.ravel()
+        return self._buf
 
     def send(self):
         """Sendet den aktuellen LED-Zustand an den Strip."""
         if not self.device:
             return False
 
-        buf = self._build_buffer()
+        self._build_buffer()
 
-        # Sende 3 × 64-Byte Chunks als HID Output Reports
+        # Sende 3 × 64-Byte Chunks als HID Output Reports; Report-ID 0x00
+        # bleibt an Position 0 des wiederverwendeten Report-Puffers
+        rep, out, mv = self._report, self.output_report, self._buf_mv
         try:
             for i in range(3):
-                chunk = buf[i * 64:(i + 1) * 64]
-                # pywinusb erwartet Report ID als erstes Byte
-                report_data = bytes([0x00]) + bytes(chunk)
-                self.output_report.set_raw_data(list(report_data))
-                self.output_report.send()
+                rep[1:65] = mv[i * 64:(i + 1) * 64]
+                out.set_raw_data(rep)
+                out.send()
             return True
         except Exception as e:
             print(f"Sendefehler: {e}")
@@ -162,7 +177,7 @@ class DXLightController:
 
     def set_all(self, r, g, b):
         """Setzt alle LEDs auf eine Farbe."""
-        self.leds = [(r, g, b)] * TOTAL_LEDS
+        self.leds[:] = (r, g, b)
         self.send()
 
     def set_led(self, index, r, g, b):
@@ -173,8 +188,7 @@ class DXLightController:
     def set_group(self, group, r, g, b):
         """Setzt eine ganze Gruppe (0=Links, 1=Oben, 2=Rechts)."""
         start = group * NUM_LEDS_PER_GROUP
-        for i in range(NUM_LEDS_PER_GROUP):
-            self.leds[start + i] = (r, g, b)
+        self.leds[start:start + NUM_LEDS_PER_GROUP] = (r, g, b)
 
     def off(self):
         """Schaltet alle LEDs aus."""
@@ -182,51 +196,64 @@ class DXLightController:
 
     def set_brightness(self, factor):
         """Skaliert alle LEDs um einen Helligkeitsfaktor (0.0 - 1.0)."""
-        factor = max(0.0, min(1.0, factor))
-        self.leds = [
-            (int(r * factor), int(g * factor), int(b * factor))
-            for r, g, b in self.leds
-        ]
+        # 8.8-Festkomma wie beim Smoothing in ambilight.py: eine
+        # Integer-Multiplikation plus Shift statt Float-Roundtrip
+        f_q8 = max(0, min(256, int(factor * 256)))
+        self.leds = ((np.asarray(self.leds, np.uint16) * f_q8) >> 8).astype(np.uint8)
         self.send()
 
     def rainbow(self, offset=0.0):
         """Setzt einen Regenbogen über alle LEDs."""
-        for i in range(TOTAL_LEDS):
-            hue = (i / TOTAL_LEDS + offset) % 1.0
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            self.leds[i] = (int(r * 255), int(g * 255), int(b * 255))
+        self.leds = _hsv_ramp(_HUE_BASE + offset)
         self.send()
 
     def breathing(self, r, g, b, speed=1.0, duration=5.0):
         """Atmungseffekt in einer bestimmten Farbe."""
-        start = time.time()
-        while time.time() - start < duration:
-            t = (time.time() - start) * speed
-            brightness = (math.sin(t * math.pi) + 1) / 2
-            self.set_all(
-                int(r * brightness),
-                int(g * brightness),
-                int(b * brightness)
-            )
-            time.sleep(0.03)
+        start = next_tick = time.perf_counter()
+        end = start + duration
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            t = (now - start) * speed
+            # Helligkeit als 8.8-Festkomma, spart drei Float-Multiplikationen
+            q = int((math.sin(t * math.pi) + 1) * 128)
+            self.set_all((r * q) >> 8, (g * q) >> 8, (b * q) >> 8)
+            # Absolute Deadlines statt fixem sleep — kein Drift über die Laufzeit
+            next_tick += _FRAME_TIME
+            wait = next_tick - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
 
     def color_cycle(self, speed=1.0, duration=10.0):
         """Farbzyklus-Animation."""
-        start = time.time()
-        while time.time() - start < duration:
-            t = (time.time() - start) * speed
-            hue = (t * 0.1) % 1.0
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            self.set_all(int(r * 255), int(g * 255), int(b * 255))
-            time.sleep(0.03)
+        start = next_tick = time.perf_counter()
+        end = start + duration
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            t = (now - start) * speed
+            r, g, b = _HUE_LUT[int(t * 0.1 * 1024) & 1023]
+            self.set_all(r, g, b)
+            next_tick += _FRAME_TIME
+            wait = next_tick - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
 
     def rainbow_wave(self, speed=1.0, duration=10.0):
         """Regenbogen-Wellen-Animation."""
-        start = time.time()
-        while time.time() - start < duration:
-            offset = (time.time() - start) * speed * 0.2
-            self.rainbow(offset)
-            time.sleep(0.03)
+        start = next_tick = time.perf_counter()
+        end = start + duration
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            self.rainbow((now - start) * speed * 0.2)
+            next_tick += _FRAME_TIME
+            wait = next_tick - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
 
     def demo(self):
         """Demo-Sequenz mit verschiedenen Effekten."""
@@ -261,22 +288,24 @@ class DXLightController:
         self.off()
 
 
+_COLOR_MAP = {
+    'red': (255, 0, 0), 'rot': (255, 0, 0),
+    'green': (0, 255, 0), 'grün': (0, 255, 0), 'gruen': (0, 255, 0),
+    'blue': (0, 0, 255), 'blau': (0, 0, 255),
+    'white': (255, 255, 255), 'weiß': (255, 255, 255), 'weiss': (255, 255, 255),
+    'yellow': (255, 255, 0), 'gelb': (255, 255, 0),
+    'cyan': (0, 255, 255),
+    'magenta': (255, 0, 255),
+    'orange': (255, 128, 0),
+    'purple': (128, 0, 255), 'lila': (128, 0, 255),
+    'pink': (255, 0, 128), 'rosa': (255, 0, 128),
+    'warm': (255, 180, 100), 'warmweiß': (255, 180, 100),
+}
+
+
 def parse_color_name(name):
     """Wandelt Farbnamen in RGB um."""
-    colors = {
-        'red': (255, 0, 0), 'rot': (255, 0, 0),
-        'green': (0, 255, 0), 'grün': (0, 255, 0), 'gruen': (0, 255, 0),
-        'blue': (0, 0, 255), 'blau': (0, 0, 255),
-        'white': (255, 255, 255), 'weiß': (255, 255, 255), 'weiss': (255, 255, 255),
-        'yellow': (255, 255, 0), 'gelb': (255, 255, 0),
-        'cyan': (0, 255, 255),
-        'magenta': (255, 0, 255),
-        'orange': (255, 128, 0),
-        'purple': (128, 0, 255), 'lila': (128, 0, 255),
-        'pink': (255, 0, 128), 'rosa': (255, 0, 128),
-        'warm': (255, 180, 100), 'warmweiß': (255, 180, 100),
-    }
-    return colors.get(name.lower())
+    return _COLOR_MAP.get(name.lower())
 
 
 def interactive_menu(ctrl):
@@ -361,8 +390,8 @@ def interactive_menu(ctrl):
                 val = float(cmd[1]) / 100.0
                 ctrl.set_brightness(val)
                 print(f"Helligkeit: {int(val * 100)}%")
-            elif parse_color_name(action):
-                r, g, b = parse_color_name(action)
+            elif (c := parse_color_name(action)):
+                r, g, b = c
                 ctrl.set_all(r, g, b)
                 print(f"{action}: ({r}, {g}, {b})")
             else:
@@ -409,8 +438,8 @@ def main():
                 r, g, b = int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4])
                 ctrl.set_all(r, g, b)
                 print(f"Farbe: ({r}, {g}, {b})")
-            elif parse_color_name(cmd):
-                r, g, b = parse_color_name(cmd)
+            elif (c := parse_color_name(cmd)):
+                r, g, b = c
                 ctrl.set_all(r, g, b)
                 print(f"{cmd}: ({r}, {g}, {b})")
             else:
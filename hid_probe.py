@@ -4,19 +4,21 @@ Nutzt pywinusb (nativ auf Windows, keine extra DLLs nötig).
 """
 
 import pywinusb.hid as hid
-import time
+import threading
 import sys
 
 VID = 0x1A86
 PID = 0xFE07
 
 received_reports = []
+_report_seen = threading.Event()
 
 def report_handler(data):
     """Callback für eingehende HID Reports."""
     hex_str = ' '.join(f'{b:02X}' for b in data)
     print(f"  << IN Report: {hex_str}")
     received_reports.append(list(data))
+    _report_seen.set()
 
 def main():
     print("=" * 60)
@@ -85,9 +87,8 @@ def main():
             device.set_raw_data_handler(report_handler)
             
             print("\n  Lese eingehende Reports (5 Sekunden)...")
-            start = time.time()
-            while time.time() - start < 5:
-                time.sleep(0.05)
+            # Blockiert bis zum ersten Report statt 100x aufzuwachen
+            _report_seen.wait(5.0)
             
             if not received_reports:
                 print("  (Keine eingehenden Reports empfangen)")
@@ -15,6 +15,9 @@ Nutzung:
 """
 
 import sys, os, time, argparse, threading
+from functools import lru_cache
+
+import numpy as np
 
 # DX-Light Controller importieren
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -60,22 +63,25 @@ def find_best_device(client, preferred_idx=None):
     return devices[0]
 
 
+@lru_cache(maxsize=8)
+def _resample_map(n_src, n_leds=36):
+    """Index-Tabelle: gleichmäßige Verteilung der Quell-LEDs auf n_leds."""
+    return (np.arange(n_leds) * n_src // n_leds) % n_src
+
+
 def sample_device_colors(device, n_leds=36):
     """Farben vom OpenRGB-Gerät auf 36 LEDs mappen."""
     colors = device.colors
     n_src = len(colors)
 
     if n_src == 0:
-        return [(0, 0, 0)] * n_leds
-
-    leds = []
-    for i in range(n_leds):
-        # Gleichmäßig über die Quell-LEDs verteilen
-        src_idx = int(i * n_src / n_leds) % n_src
-        c = colors[src_idx]
-        leds.append((c.red, c.green, c.blue))
+        return np.zeros((n_leds, 3), np.uint8)
 
-    return leds
+    src = np.fromiter(
+        (v for c in colors for v in (c.red, c.green, c.blue)),
+        np.uint8, 3 * n_src,
+    ).reshape(n_src, 3)
+    return src[_resample_map(n_src, n_leds)]
 
 
 def run_bridge(client, device, fps=30):
@@ -7,11 +7,27 @@ Keine externen Dependencies nötig — nutzt PowerShell/WMI.
 """
 
 import subprocess
-import time
 import json
+import re
 import sys
 import os
 
+_VIDPID_RE = re.compile(r"VID_([0-9A-Fa-f]{4}).*?PID_([0-9A-Fa-f]{4})")
+
+# Persistenter Event-Watcher: meldet pro Geräteänderung eine Zeile "CHANGE",
+# statt alle 2 s eine neue PowerShell zu starten und den ganzen USB-Baum
+# zu vergleichen. Details werden nur noch bei einem Ereignis abgefragt.
+_EVENT_PS = """
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+Register-WmiEvent -Class Win32_DeviceChangeEvent -SourceIdentifier devchange | Out-Null
+Write-Output "READY"
+while ($true) {
+    $e = Wait-Event -SourceIdentifier devchange
+    $e | Remove-Event
+    Write-Output "CHANGE"
+}
+"""
+
 def run_ps(ps_cmd, timeout=30):
     """Führt PowerShell-Befehl mit UTF-8 Encoding aus."""
     env = os.environ.copy()
@@ -60,13 +76,9 @@ def format_device(dev):
     mfg = dev.get("Manufacturer", "?")
     
     # VID/PID extrahieren
-    vid = pid = "????"
-    did = device_id.upper()
-    if "VID_" in did:
-        vid = did.split("VID_")[1][:4]
-    if "PID_" in did:
-        pid = did.split("PID_")[1][:4]
-    
+    m = _VIDPID_RE.search(device_id)
+    vid, pid = (m.group(1).upper(), m.group(2).upper()) if m else ("????", "????")
+
     return f"  VID:PID = 0x{vid}:0x{pid}\n  Name: {name}\n  Beschreibung: {desc}\n  Hersteller: {mfg}\n  DeviceID: {device_id}"
 
 def main():
@@ -92,11 +104,20 @@ def main():
     print(">>> Drücke Ctrl+C zum Beenden.                           <<<")
     print()
     
+    watcher = subprocess.Popen(
+        ["powershell", "-NoProfile", "-Command", _EVENT_PS],
+        stdout=subprocess.PIPE, stdin=subprocess.DEVNULL,
+        encoding="utf-8", errors="replace"
+    )
+
     try:
-        while True:
-            time.sleep(2)
+        # Blockiert auf dem Watcher statt zu pollen; der USB-Baum wird nur
+        # noch bei einem gemeldeten Geräteereignis neu abgefragt
+        for line in watcher.stdout:
+            if "CHANGE" not in line:
+                continue
             current = get_usb_devices_detailed()
-            
+
             # Neue Geräte finden
             new_ids = set(current.keys()) - set(baseline.keys())
             if new_ids:
@@ -109,18 +130,23 @@ def main():
                     print(format_device(dev))
                     print()
                 print("-" * 60)
-                
+
                 # Baseline updaten
                 baseline = current
-            
+
             # Entfernte Geräte
             removed_ids = set(baseline.keys()) - set(current.keys())
             if removed_ids:
                 print(f"[Entfernt: {len(removed_ids)} Gerät(e)]")
                 baseline = current
-                
+
     except KeyboardInterrupt:
         print("\nBeendet.")
+    finally:
+        try:
+            watcher.terminate()
+        except:
+            pass
 
 if __name__ == "__main__":
     main()